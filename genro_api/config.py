@@ -16,6 +16,7 @@
 """Publisher configuration with persistent storage."""
 
 import sqlite3
+import threading
 from typing import Annotated
 
 from pydantic import BaseModel, Field
@@ -59,46 +60,74 @@ class PublisherConfig:
             db_path: Path to SQLite database file. Use ":memory:" for in-memory.
         """
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        # Autocommit: reads run outside any transaction, writes open one explicitly
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        # One writer at a time: transactions on the shared connection must not interleave
+        self._write_lock = threading.Lock()
+        self._configure_pragmas()
         self._create_table()
         self._init_defaults()
+        self._load_cache()
+
+    def _configure_pragmas(self) -> None:
+        """Tune the connection for a small, frequently read table.
+
+        WAL (file databases only) lets readers proceed during a write and,
+        with synchronous=NORMAL, avoids an fsync per commit. Memory-mapped
+        I/O serves page reads without a read() call each; SQLite silently
+        ignores it where mmap is unavailable. Lock waits are already bounded
+        by sqlite3.connect's 5 second default timeout.
+        """
+        if self.db_path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA mmap_size=268435456")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")
 
     def _create_table(self) -> None:
         """Create config table if it doesn't exist."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        self.conn.execute("""
             CREATE TABLE IF NOT EXISTS publisher_config (
                 key TEXT PRIMARY KEY,
                 value TEXT NOT NULL,
                 description TEXT
             )
         """)
-        self.conn.commit()
 
     def _init_defaults(self) -> None:
         """Initialize default config values if not present."""
-        cursor = self.conn.cursor()
-        for key, value in self.DEFAULTS.items():
-            cursor.execute(
+        with self.conn:
+            self.conn.execute("BEGIN")
+            self.conn.executemany(
                 "INSERT OR IGNORE INTO publisher_config (key, value) VALUES (?, ?)",
-                (key, value)
+                self.DEFAULTS.items()
             )
-        self.conn.commit()
+
+    def _load_cache(self) -> None:
+        """Load every stored value into the in-process cache.
+
+        Reads are served from the cache, which every write updates in
+        lockstep; it assumes this instance is the only writer to the database.
+        """
+        self._cache: dict[str, str] = dict(
+            self.conn.execute("SELECT key, value FROM publisher_config").fetchall()
+        )
 
     @apiready
     def get_config(
         self, key: Annotated[str, "Configuration key"]
     ) -> str:
         """Get a configuration value."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT value FROM publisher_config WHERE key = ?", (key,)
-        )
-        row = cursor.fetchone()
-        if not row:
+        value = self._cache.get(key)
+        if value is None:
             return self.DEFAULTS.get(key, "")
-        return row["value"]
+        return value
+
+    @apiready
+    def get_all_config(self) -> dict[str, str]:
+        """Get all configuration values as a key/value mapping."""
+        return dict(self._cache)
 
     @apiready
     def set_config(
@@ -107,29 +136,32 @@ class PublisherConfig:
         value: Annotated[str, "Configuration value"]
     ) -> dict:
         """Set a configuration value."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "INSERT OR REPLACE INTO publisher_config (key, value) VALUES (?, ?)",
-            (key, value)
-        )
-        self.conn.commit()
+        self._set_many([(key, value)])
         return {"key": key, "value": value, "status": "updated"}
 
+    def _set_many(self, pairs: list[tuple[str, str]]) -> None:
+        """Store several key/value pairs in one transaction and update the cache."""
+        with self._write_lock:
+            with self.conn:
+                self.conn.execute("BEGIN")
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO publisher_config (key, value) VALUES (?, ?)",
+                    pairs
+                )
+            self._cache.update(pairs)
+
     @apiready
     def list_all_config(self) -> list[dict]:
         """List all configuration values."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT key, value FROM publisher_config ORDER BY key")
         return [
-            {"key": row["key"], "value": row["value"]}
-            for row in cursor.fetchall()
+            {"key": key, "value": value}
+            for key, value in sorted(self._cache.items())
         ]
 
     @apiready
     def set_dialog_size(self, config: DialogSizeConfig) -> dict:
         """Set dialog size preferences."""
-        self.set_config("dialog_width", config.width)
-        self.set_config("dialog_height", config.height)
+        self._set_many([("dialog_width", config.width), ("dialog_height", config.height)])
         return {
             "width": config.width,
             "height": config.height,
@@ -139,8 +171,10 @@ class PublisherConfig:
     @apiready
     def set_grid_padding(self, config: GridPaddingConfig) -> dict:
         """Set grid cell padding."""
-        self.set_config("grid_cell_padding_vertical", config.vertical)
-        self.set_config("grid_cell_padding_horizontal", config.horizontal)
+        self._set_many([
+            ("grid_cell_padding_vertical", config.vertical),
+            ("grid_cell_padding_horizontal", config.horizontal),
+        ])
         return {
             "vertical": config.vertical,
             "horizontal": config.horizontal,
@@ -150,13 +184,7 @@ class PublisherConfig:
     @apiready
     def reset_to_defaults(self) -> dict:
         """Reset all configuration to default values."""
-        cursor = self.conn.cursor()
-        for key, value in self.DEFAULTS.items():
-            cursor.execute(
-                "INSERT OR REPLACE INTO publisher_config (key, value) VALUES (?, ?)",
-                (key, value)
-            )
-        self.conn.commit()
+        self._set_many(list(self.DEFAULTS.items()))
         return {"status": "Configuration reset to defaults. Refresh page to apply."}
 
     def close(self) -> None:
@@ -15,9 +15,15 @@
 
 """Publisher for automatic API exposure from @apiready decorated classes."""
 
+import functools
 import inspect
 import logging
-from typing import Any, Optional
+import re
+import types
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass, fields as dataclass_fields, is_dataclass
+from typing import Any, Callable, Iterator, Optional, Union, get_args, get_origin
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.routing import APIRouter
@@ -26,6 +32,339 @@ from genro_core import get_api_structure
 
 logger = logging.getLogger(__name__)
 
+# Basic types for type strings from introspection
+_TYPE_MAPPING = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "dict": dict,
+    "list": list,
+    "Any": Any,
+}
+
+# Parameterized type strings, e.g. "list[str]" or "Optional[int]"
+_COMPLEX_RE = re.compile(r"^(list|dict|tuple|set|Optional)\[(.+)\]$")
+_GENERIC_ORIGINS = {"list": list, "dict": dict, "tuple": tuple, "set": set}
+
+# Types FastAPI can read from a query string, alone or as list/set/tuple items
+_QUERY_SCALARS = (str, int, float, bool, Any)
+
+# Result grids with more rows than this are paginated
+_GRID_PAGE_SIZE = 100
+
+
+def _split_type_args(args: str) -> list[str]:
+    """Split the arguments of a parameterized type string at top-level commas."""
+    parts = []
+    depth = start = 0
+    for index, char in enumerate(args):
+        if char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(args[start:index].strip())
+            start = index + 1
+    parts.append(args[start:].strip())
+    return parts
+
+
+@dataclass(slots=True, frozen=True)
+class _EndpointSpec:
+    """Endpoint metadata from introspection, unpacked once at publish time."""
+
+    func_name: str
+    path: str
+    method: str
+    params: dict
+    return_type: dict
+    description: str
+    transaction: bool
+
+    @classmethod
+    def from_info(cls, endpoint_info: dict[str, Any]) -> "_EndpointSpec":
+        """
+        Build a spec from an introspection endpoint dict.
+
+        Endpoint info structure:
+            {
+                "function_name": str,
+                "path": str,
+                "method": str (GET/POST),
+                "parameters": dict,  # {param_name: {type, required, default, description}}
+                "return_type": dict,  # {type, description}
+                "description": str,
+                "transaction": bool  # Whether to execute in a transaction
+            }
+        """
+        return cls(
+            endpoint_info["function_name"],
+            endpoint_info["path"],
+            endpoint_info["method"],
+            endpoint_info.get("parameters", {}),
+            endpoint_info.get("return_type", {}),
+            endpoint_info.get("description", ""),
+            endpoint_info.get("transaction", False),
+        )
+
+
+def _parse_default(default: Any, convert: Callable[[Any], Any]) -> Any:
+    """Convert a parameter default for a form widget, or None if there is none."""
+    if not default or default == "...":
+        return None
+    try:
+        return convert(default)
+    except (TypeError, ValueError):
+        return None
+
+
+def _keep_value(value: Any) -> Any:
+    """Pass a widget value through unchanged."""
+    return value
+
+
+def _whole_number_to_int(value: Any) -> Any:
+    """ui.number yields floats: hand whole numbers to int parameters as int."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _make_text_input(ui: Any, param: "_ParamPlan") -> Any:
+    """Text input for string and complex-type parameters."""
+    return ui.input(
+        label=param.label, placeholder=param.description, value=param.default
+    ).classes("w-full")
+
+
+def _make_int_input(ui: Any, param: "_ParamPlan") -> Any:
+    """Number input for integer parameters."""
+    return ui.number(
+        label=param.label, placeholder=param.description, value=param.default
+    ).classes("w-full")
+
+
+def _make_float_input(ui: Any, param: "_ParamPlan") -> Any:
+    """Number input with two decimals for float parameters."""
+    return ui.number(
+        label=param.label, placeholder=param.description, value=param.default, format="%.2f"
+    ).classes("w-full")
+
+
+def _make_checkbox(ui: Any, param: "_ParamPlan") -> Any:
+    """Checkbox for boolean parameters."""
+    return ui.checkbox(text=param.label, value=param.default)
+
+
+# Form widget per parameter type string: (widget factory, default converter, value coercer)
+_WIDGETS: dict[
+    str,
+    tuple[Callable[[Any, "_ParamPlan"], Any], Callable[[Any], Any], Callable[[Any], Any]],
+] = {
+    "str": (_make_text_input, lambda default: default if default != "..." else "", _keep_value),
+    "string": (_make_text_input, lambda default: default if default != "..." else "", _keep_value),
+    "int": (_make_int_input, lambda default: _parse_default(default, int), _whole_number_to_int),
+    "integer": (
+        _make_int_input, lambda default: _parse_default(default, int), _whole_number_to_int
+    ),
+    "float": (_make_float_input, lambda default: _parse_default(default, float), _keep_value),
+    "bool": (_make_checkbox, lambda default: bool(default) if default else False, _keep_value),
+    "boolean": (_make_checkbox, lambda default: bool(default) if default else False, _keep_value),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class _ParamPlan:
+    """Form field for one method parameter, resolved at registration time."""
+
+    name: str
+    label: str
+    description: str
+    required: bool
+    default: Any
+    factory: Callable[[Any, "_ParamPlan"], Any]
+    coerce: Callable[[Any], Any]
+
+    @classmethod
+    def from_info(cls, param_name: str, param_info: dict[str, Any]) -> "_ParamPlan":
+        """Pick the widget, default and value coercion for an introspected parameter."""
+        param_type = param_info.get("type", "str")
+        param_required = param_info.get("required", True)
+        param_default = param_info.get("default", "")
+
+        label = param_name.replace("_", " ").title()
+        if param_required:
+            label += " *"
+
+        widget = _WIDGETS.get(param_type)
+        if widget is None:
+            # Default to text input for complex types
+            factory, convert_value = _make_text_input, _keep_value
+            label = f"{label} ({param_type})"
+            default = str(param_default) if param_default and param_default != "..." else ""
+        else:
+            factory, convert_default, convert_value = widget
+            default = convert_default(param_default)
+
+        if param_required:
+            coerce = convert_value
+        else:
+            def coerce(value: Any) -> Any:
+                # Convert empty strings to None for optional parameters
+                return None if value == "" else convert_value(value)
+
+        return cls(
+            param_name,
+            label,
+            param_info.get("description", ""),
+            param_required,
+            default,
+            factory,
+            coerce,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class _MethodPlan:
+    """How the admin UI renders one method, resolved at registration time."""
+
+    label: str
+    color: str
+    is_destructive: bool
+    needs_dialog: bool
+    params: tuple[_ParamPlan, ...]
+
+    @classmethod
+    def build(cls, method_name: str, http_method: str, parameters: dict) -> "_MethodPlan":
+        """Build the plan for a method from its name, HTTP method and parameters."""
+        # Choose button color based on HTTP method
+        if http_method == "GET":
+            color = "primary"
+        elif method_name.startswith(("add", "create")):
+            color = "positive"
+        elif method_name.startswith(("remove", "delete")):
+            color = "negative"
+        elif method_name.startswith(("update", "move", "edit")):
+            color = "warning"
+        else:
+            color = "secondary"
+
+        # Methods with parameters or destructive effects go through a dialog
+        is_destructive = method_name.startswith(("remove", "delete"))
+        params = tuple(
+            _ParamPlan.from_info(param_name, param_info)
+            for param_name, param_info in parameters.items()
+        )
+        return cls(
+            # Beautify method name: add_shelf -> Add Shelf
+            method_name.replace("_", " ").title(),
+            color,
+            is_destructive,
+            bool(params) or is_destructive,
+            params,
+        )
+
+
+def _iter_public_attrs(obj: object) -> Iterator[tuple[str, Any]]:
+    """Yield the public attributes stored on an instance, from __dict__ and __slots__."""
+    for name, value in getattr(obj, "__dict__", {}).items():
+        if not name.startswith('_'):
+            yield name, value
+
+    for klass in type(obj).__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name.startswith('_'):
+                continue
+            try:
+                yield name, getattr(obj, name)
+            except AttributeError:
+                # Unset slot
+                continue
+
+
+def _iter_public_properties(obj: object) -> Iterator[tuple[str, Any]]:
+    """Yield the public properties of an instance's class, evaluated on the instance."""
+    cls = type(obj)
+    for name in dir(cls):
+        if name.startswith('_') or not isinstance(inspect.getattr_static(cls, name), property):
+            continue
+        try:
+            yield name, getattr(obj, name)
+        except Exception:
+            # A failing property is not a child
+            continue
+
+
+def _query_type(field_type: Any) -> Any:
+    """
+    Return the annotation for a GET query parameter of the given type.
+
+    Query strings carry scalars and flat sequences of scalars only; anything
+    else (dicts, nested generics) is declared as Any, as it was before type
+    strings were parsed, so publishing does not fail on it.
+    """
+    if field_type in _QUERY_SCALARS or field_type in (list, set, tuple):
+        return field_type
+
+    origin = get_origin(field_type)
+    args = get_args(field_type)
+    if origin in (Union, types.UnionType):
+        non_none = [arg for arg in args if arg is not type(None)]
+        if len(non_none) == 1:
+            inner = _query_type(non_none[0])
+            return Any if inner is Any else inner | None
+        return Any
+    if origin in (list, set, tuple) and all(
+        arg is ... or arg in _QUERY_SCALARS for arg in args
+    ):
+        return field_type
+    return Any
+
+
+@functools.lru_cache(maxsize=None)
+def _build_request_spec(
+    func_name: str, fields: tuple[tuple[str, Any, bool, Any], ...]
+) -> tuple[type[BaseModel], inspect.Signature]:
+    """
+    Build the request model and query-string signature for an endpoint.
+
+    Both depend only on the method name and its parameter metadata, so they
+    are built once and shared by every endpoint with the same specification.
+
+    Args:
+        func_name: Name of the published method
+        fields: (name, type, required, default) for each parameter
+
+    Returns:
+        Tuple of (Pydantic request model, signature with Query() defaults)
+    """
+    model_fields = {}
+    sig_params = []
+    for param_name, field_type, param_required, param_default in fields:
+        if param_required:
+            model_fields[param_name] = (field_type, ...)
+            default_value = Query(...)
+        elif param_default == "None" or param_default is None:
+            model_fields[param_name] = (field_type | None, None)
+            default_value = Query(None)
+        else:
+            model_fields[param_name] = (field_type, param_default)
+            default_value = Query(param_default)
+
+        sig_params.append(
+            inspect.Parameter(
+                param_name,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=default_value,
+                annotation=_query_type(field_type)
+            )
+        )
+
+    request_model = create_model(f"{func_name.title()}Request", **model_fields)
+    return request_model, inspect.Signature(sig_params)
+
 
 class Publisher:
     """
@@ -91,10 +430,11 @@ class Publisher:
         self._rest_routers: dict[str, APIRouter] = {}
         self._ui_registry: dict[str, dict[str, Any]] = {}
         self._base_paths: set[str] = set()
+        self._ordered_registry_cache: list[tuple[str, dict]] | None = None
+        # Public attributes of parent instances by class name, built on first child lookup
+        self._child_indexes: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
-        logger.info(
-            f"Publisher initialized: {title} v{version} on {host}:{port}"
-        )
+        logger.info("Publisher initialized: %s v%s on %s:%s", title, version, host, port)
 
     def publish(self, instance: object) -> None:
         """
@@ -135,185 +475,224 @@ class Publisher:
 
         self._base_paths.add(base_path)
         self._published_instances.append((instance, cls))
+        self._ordered_registry_cache = None
+
+        logger.info("Publishing %s at %s", cls.__name__, base_path)
+
+        if not (self.enable_rest or self.enable_ui):
+            return
+
+        # Introspect once: REST endpoints and UI registration share the structure
+        try:
+            structure = get_api_structure(instance, eager=True, mode="dict")
+        except Exception as e:
+            logger.error("Failed to introspect %s: %s", cls.__name__, e)
+            raise
 
-        logger.info(f"Publishing {cls.__name__} at {base_path}")
+        # Locate the class tree once; REST and UI registration share its nodes
+        nodes = list(self._walk_class_tree(instance, structure, base_path))
 
         # Generate REST endpoints
         if self.enable_rest:
-            self._generate_rest_endpoints(instance, cls)
+            for path, inst, struct, _ in nodes:
+                self._generate_rest_endpoints(path, inst, struct)
 
         # Register for UI generation
         if self.enable_ui:
-            self._register_ui_components(instance, cls)
+            self._register_ui_components(nodes)
+
+    def _walk_class_tree(
+        self, instance: object, structure: dict, base_path: str
+    ) -> Iterator[tuple[str, object, dict, Optional[str]]]:
+        """
+        Walk a published instance and its children depth-first.
+
+        Child instances are looked up once per publish, and each base path is
+        visited once.
+
+        Args:
+            instance: Published instance
+            structure: API structure from eager introspection of the instance
+            base_path: Base path of the published class
 
-    def _generate_rest_endpoints(self, instance: object, cls: type) -> None:
+        Yields:
+            (base_path, instance, structure, parent_path) for each class
         """
-        Generate REST endpoints for a published class.
+        seen = set()
+        stack = [(structure.get("base_path") or base_path, instance, structure, None)]
+        while stack:
+            path, inst, struct, parent_path = stack.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            yield path, inst, struct, parent_path
+
+            children = []
+            for child_structure in struct.get("children", []):
+                # Find the child instance from parent
+                # For manager pattern: it's an instance attribute
+                # For module-level classes: we need to instantiate or skip
+                child_instance = self._find_child_instance(inst, child_structure)
+
+                if child_instance is None:
+                    # Module-level class without instance - skip for now
+                    logger.warning(
+                        "Child class %s not found as instance attribute. "
+                        "Module-level classes require instance to be published separately.",
+                        child_structure["class_name"],
+                    )
+                    continue
+
+                child_path = child_structure.get("base_path") or path
+                children.append((child_path, child_instance, child_structure, path))
+
+            # Reversed, so children are visited in introspection order
+            stack.extend(reversed(children))
+
+    def _generate_rest_endpoints(self, base_path: str, instance: object, structure: dict) -> None:
+        """
+        Generate REST endpoints for a published class or one of its children.
 
         Reads metadata from @apiready methods and creates FastAPI endpoints
         with proper request/response models and documentation.
 
-        This method also recursively generates endpoints for child classes
-        (discovered via eager introspection).
-
         Args:
+            base_path: Router prefix for the class
             instance: Instance of the class
-            cls: Class type
+            structure: API structure from eager introspection of the class
         """
-        base_path = cls._api_base_path
-        logger.debug(f"Generating REST endpoints for {cls.__name__} at {base_path}")
-
-        # Get API structure using introspection with eager mode
-        try:
-            structure = get_api_structure(instance, eager=True, mode="dict")
-        except Exception as e:
-            logger.error(f"Failed to introspect {cls.__name__}: {e}")
-            raise
+        class_name = structure.get("class_name") or type(instance).__name__
+        logger.debug("Generating REST endpoints for %s at %s", class_name, base_path)
 
         # Create router for this class
-        router = APIRouter(prefix=base_path, tags=[cls.__name__])
+        router = APIRouter(prefix=base_path, tags=[class_name])
 
         # Generate endpoint for each method
-        for endpoint_info in structure["endpoints"]:
-            self._create_endpoint(router, instance, endpoint_info)
+        for spec in map(_EndpointSpec.from_info, structure["endpoints"]):
+            self._create_endpoint(router, instance, spec)
 
         # Register router with app
         self._rest_routers[base_path] = router
         self.app.include_router(router)
 
         logger.info(
-            f"REST endpoints registered for {cls.__name__}: "
-            f"{len(structure['endpoints'])} endpoints"
+            "REST endpoints registered for %s: %d endpoints",
+            class_name, len(structure["endpoints"]),
         )
 
-        # Recursively generate endpoints for children
-        if "children" in structure:
-            for child_structure in structure["children"]:
-                self._generate_child_endpoints(instance, child_structure)
-
-    def _generate_child_endpoints(self, parent_instance: object, child_structure: dict) -> None:
+    def _find_child_instance(self, parent_instance: object, child_structure: dict) -> Any:
         """
-        Generate REST endpoints for a child class discovered via eager introspection.
+        Find the instance of a child class on its parent.
+
+        Uses the attribute name from introspection when provided, then the
+        parent's index of public instance attributes, built once per parent and
+        shared by all of its children, and finally the parent's public
+        properties, evaluated only on a miss. Candidates are matched with isinstance
+        when introspection supplies the class object ("class_obj"), falling
+        back to comparing class names.
 
         Args:
             parent_instance: Parent instance that contains the child
             child_structure: Child class structure from introspection
+
+        Returns:
+            The child instance, or None if not found
         """
+        child_cls = child_structure.get("class_obj")
         child_class_name = child_structure["class_name"]
-        child_base_path = child_structure["base_path"]
-
-        logger.debug(f"Generating child endpoints for {child_class_name} at {child_base_path}")
-
-        # Find the child instance from parent
-        # For manager pattern: it's an instance attribute
-        # For module-level classes: we need to instantiate or skip
-        child_instance = None
-
-        # Try to find as instance attribute
-        for attr_name in dir(parent_instance):
-            if attr_name.startswith('_'):
-                continue
-            try:
-                attr = getattr(parent_instance, attr_name)
-                if hasattr(attr, '__class__') and attr.__class__.__name__ == child_class_name:
-                    child_instance = attr
-                    break
-            except:
-                continue
-
-        if child_instance is None:
-            # Module-level class without instance - skip for now
-            logger.warning(
-                f"Child class {child_class_name} not found as instance attribute. "
-                f"Module-level classes require instance to be published separately."
-            )
-            return
+        if isinstance(child_cls, type):
+            def matches(attr: Any) -> bool:
+                return isinstance(attr, child_cls)
+        else:
+            child_cls = None
 
-        # Create router for child class
-        router = APIRouter(prefix=child_base_path, tags=[child_class_name])
+            def matches(attr: Any) -> bool:
+                return type(attr).__name__ == child_class_name
 
-        # Generate endpoint for each child method
-        for endpoint_info in child_structure["endpoints"]:
-            self._create_endpoint(router, child_instance, endpoint_info)
+        attr_name = child_structure.get("attr_name")
+        if attr_name:
+            attr = getattr(parent_instance, attr_name, None)
+            if attr is not None and matches(attr):
+                return attr
 
-        # Register router with app
-        self._rest_routers[child_base_path] = router
-        self.app.include_router(router)
-
-        logger.info(
-            f"Child endpoints registered for {child_class_name}: "
-            f"{len(child_structure['endpoints'])} endpoints"
+        index = self._index_children(parent_instance)
+        if child_cls is None:
+            child = index.get(child_class_name)
+        else:
+            child = next((attr for attr in index.values() if matches(attr)), None)
+        if child is not None:
+            return child
+
+        # Children exposed through properties are not in the index; they are
+        # evaluated only when the stored attributes have no match
+        return next(
+            (attr for _, attr in _iter_public_properties(parent_instance) if matches(attr)),
+            None,
         )
 
-    def _register_ui_components(self, instance: object, cls: type) -> None:
+    def _index_children(self, parent_instance: object) -> dict[str, Any]:
         """
-        Register components for UI generation.
+        Index a parent's public attributes by class name.
 
-        Collects @apiready methods and stores them for NiceGUI interface generation.
-        Also registers child classes recursively.
+        Reads the instance's own attributes (its __dict__ and __slots__), so
+        properties and other computed attributes are never evaluated. The first
+        attribute found for each class name is kept.
 
         Args:
-            instance: Instance of the class
-            cls: Class type
-        """
-        base_path = cls._api_base_path
-        logger.debug(f"Registering UI components for {cls.__name__} at {base_path}")
+            parent_instance: Parent instance to scan
 
-        # Get API structure using introspection
+        Returns:
+            Mapping of class name to attribute value
+        """
         try:
-            structure = get_api_structure(instance, eager=True, mode="dict")
-        except Exception as e:
-            logger.error(f"Failed to introspect {cls.__name__} for UI: {e}")
-            return
-
-        # First, collect all classes to register (using set to avoid duplicates)
-        classes_to_register = {}  # {base_path: (instance, structure, parent_path)}
-
-        def collect_classes(inst, struct, parent_path=None):
-            """Recursively collect all classes to register."""
-            cls_path = struct.get("base_path") or parent_path
-            if cls_path and cls_path not in classes_to_register:
-                classes_to_register[cls_path] = (inst, struct, parent_path)
-
-                # Recurse into children
-                for child_info in struct.get("children", []):
-                    child_path = child_info.get("base_path")
-                    child_class_name = child_info.get("class_name")
+            return self._child_indexes[parent_instance]
+        except (KeyError, TypeError):
+            pass
 
-                    # Find child instance
-                    child_instance = None
-                    for attr_name in dir(inst):
-                        try:
-                            attr = getattr(inst, attr_name)
-                            if hasattr(attr, '__class__') and attr.__class__.__name__ == child_class_name:
-                                child_instance = attr
-                                break
-                        except:
-                            continue
+        index: dict[str, Any] = {}
+        for _, attr in _iter_public_attrs(parent_instance):
+            index.setdefault(type(attr).__name__, attr)
 
-                    if child_instance:
-                        collect_classes(child_instance, child_info, cls_path)
+        try:
+            self._child_indexes[parent_instance] = index
+        except TypeError:
+            # Not weak-referenceable or unhashable: rescan on the next lookup
+            pass
+        return index
+
+    def _register_ui_components(
+        self, nodes: list[tuple[str, object, dict, Optional[str]]]
+    ) -> None:
+        """
+        Register components for UI generation.
 
-        # Collect all classes starting from root
-        collect_classes(instance, structure, None)
+        Collects @apiready methods and stores them for NiceGUI interface generation,
+        for the published class and each of its children.
 
-        # Now register all collected classes
-        for path, (inst, struct, parent) in classes_to_register.items():
+        Args:
+            nodes: (base_path, instance, structure, parent_path) from _walk_class_tree
+        """
+        for path, inst, struct, parent in nodes:
+            inst_cls = type(inst)
             ui_methods = []
             for endpoint_info in struct.get("endpoints", []):
+                parameters = endpoint_info.get("parameters", {})
                 ui_methods.append({
                     "name": endpoint_info["function_name"],
                     "path": endpoint_info["path"],
                     "method": endpoint_info["method"],
-                    "parameters": endpoint_info.get("parameters", {}),
+                    "parameters": parameters,
                     "description": endpoint_info.get("description", ""),
-                    "bound_method": getattr(inst, endpoint_info["function_name"])
+                    "bound_method": getattr(inst, endpoint_info["function_name"]),
+                    "plan": _MethodPlan.build(
+                        endpoint_info["function_name"], endpoint_info["method"], parameters
+                    ),
                 })
 
             registry_entry = {
                 "instance": inst,
-                "class": type(inst),
-                "class_name": struct.get("class_name") or type(inst).__name__,
+                "class": inst_cls,
+                "class_name": struct.get("class_name") or inst_cls.__name__,
                 "methods": ui_methods,
                 "parent_path": parent,
             }
@@ -326,31 +705,36 @@ class Publisher:
 
             self._ui_registry[path] = registry_entry
 
-            logger.info(f"UI components registered for {type(inst).__name__}: {len(ui_methods)} methods")
+            logger.info(
+                "UI components registered for %s: %d methods", inst_cls.__name__, len(ui_methods)
+            )
 
     def run(self, **kwargs: Any) -> None:
         """
         Start the server.
 
-        This method starts uvicorn with the FastAPI application and NiceGUI integration.
+        This method starts uvicorn once with the FastAPI application; when the UI
+        is enabled, NiceGUI is first mounted on that same application.
 
         Args:
-            **kwargs: Additional parameters passed to uvicorn.run() or ui.run()
+            **kwargs: Additional parameters passed to uvicorn.run()
                      Common options:
-                     - reload: bool = Enable auto-reload (development)
                      - log_level: str = Logging level
-                     - workers: int = Number of worker processes
+                     - access_log: bool = Enable the access log
+                     reload and workers are not available: uvicorn only
+                     accepts them with an import string, and the published
+                     instances live in this process.
 
         Examples:
-            >>> publisher.run()  # Production
-            >>> publisher.run(reload=True)  # Development with auto-reload
+            >>> publisher.run()
+            >>> publisher.run(log_level="debug")
         """
-        logger.info(f"Starting server on {self.host}:{self.port}")
+        logger.info("Starting server on %s:%s", self.host, self.port)
 
         if self.enable_swagger:
-            logger.info(f"Swagger UI: http://{self.host}:{self.port}/docs")
+            logger.info("Swagger UI: http://%s:%s/docs", self.host, self.port)
         if self.enable_ui:
-            logger.info(f"Admin UI: http://{self.host}:{self.port}/admin")
+            logger.info("Admin UI: http://%s:%s/admin", self.host, self.port)
 
         # Setup NiceGUI if enabled and start with integrated server
         if self.enable_ui:
@@ -366,80 +750,87 @@ class Publisher:
                 storage_secret="genro-secret-key"  # Required for NiceGUI
             )
 
-            # Now run with uvicorn
-            import uvicorn
-            uvicorn.run(
-                self.app,
-                host=self.host,
-                port=self.port,
-                **kwargs,
-            )
-        else:
-            # Use standard uvicorn if no UI
-            import uvicorn
+        # All routes are in place: build the cached OpenAPI schema once, up front,
+        # instead of on the first /docs or /openapi.json request
+        if self.enable_swagger:
+            self.app.openapi()
 
-            uvicorn.run(
-                self.app,
-                host=self.host,
-                port=self.port,
-                **kwargs,
-            )
+        # Serve the app (with NiceGUI mounted, if enabled) with uvicorn. Its default
+        # loop="auto"/http="auto" already pick uvloop and httptools when installed.
+        import uvicorn
+
+        uvicorn.run(
+            self.app,
+            host=self.host,
+            port=self.port,
+            **kwargs,
+        )
 
     def _get_ordered_ui_registry(self) -> list[tuple[str, dict]]:
         """
         Get UI registry ordered by depth-first traversal with config classes last.
 
+        The order only changes when something is published, so it is computed
+        once and reused by every admin page load.
+
         Returns:
             List of (base_path, registry) tuples in the correct order
         """
-        # Debug: log what's in the registry
-        print(f"DEBUG: UI Registry contents: {list(self._ui_registry.keys())}")
-        for path, reg in self._ui_registry.items():
-            print(f"DEBUG:   {path}: {reg['class_name']} (parent: {reg.get('parent_path')})")
+        if self._ordered_registry_cache is not None:
+            return self._ordered_registry_cache
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("UI Registry contents: %s", list(self._ui_registry))
+            for path, reg in self._ui_registry.items():
+                logger.debug(
+                    "  %s: %s (parent: %s)", path, reg["class_name"], reg.get("parent_path")
+                )
 
         ordered_paths = []
         visited = set()
         config_paths = []
 
-        def depth_first_traverse(base_path: str):
-            """Recursively traverse and collect paths depth-first."""
-            if base_path in visited:
-                return
-            visited.add(base_path)
-            ordered_paths.append(base_path)
-
-            # Find all children of this path
-            for child_path, child_registry in self._ui_registry.items():
-                if child_registry.get("parent_path") == base_path:
-                    depth_first_traverse(child_path)
+        # Children of each path, in registration order
+        children_by_parent = defaultdict(list)
+        for child_path, child_registry in self._ui_registry.items():
+            children_by_parent[child_registry.get("parent_path")].append(child_path)
 
         # Separate config classes from others
         root_paths = []
-        for base_path, registry in self._ui_registry.items():
-            if registry.get("parent_path") is None:
-                # Check if it's a config class (ends with _config or contains "config" in name)
-                class_name = registry["class_name"].lower()
-                if "config" in class_name:
-                    config_paths.append(base_path)
-                else:
-                    root_paths.append(base_path)
+        for base_path in children_by_parent.get(None, ()):
+            # Check if it's a config class (ends with _config or contains "config" in name)
+            class_name = self._ui_registry[base_path]["class_name"].lower()
+            if "config" in class_name:
+                config_paths.append(base_path)
+            else:
+                root_paths.append(base_path)
 
-        # Traverse root classes depth-first
-        print(f"DEBUG: Root paths to traverse: {root_paths}")
-        print(f"DEBUG: Config paths to append: {config_paths}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Root paths to traverse: %s", root_paths)
+            logger.debug("Config paths to append: %s", config_paths)
 
-        for root_path in sorted(root_paths):  # Sort alphabetically for consistency
-            depth_first_traverse(root_path)
+        # Traverse root classes depth-first with an explicit stack;
+        # visited guards against parent cycles
+        stack = sorted(root_paths, reverse=True)  # Sort alphabetically for consistency
+        while stack:
+            base_path = stack.pop()
+            if base_path in visited:
+                continue
+            visited.add(base_path)
+            ordered_paths.append(base_path)
+            stack.extend(reversed(children_by_parent.get(base_path, ())))
 
         # Add config classes at the end
         for config_path in sorted(config_paths):
             if config_path not in visited:
                 ordered_paths.append(config_path)
 
-        print(f"DEBUG: Final ordered paths: {ordered_paths}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Final ordered paths: %s", ordered_paths)
 
-        # Return ordered list of (base_path, registry) tuples
-        return [(path, self._ui_registry[path]) for path in ordered_paths]
+        # Ordered list of (base_path, registry) tuples
+        self._ordered_registry_cache = [(path, self._ui_registry[path]) for path in ordered_paths]
+        return self._ordered_registry_cache
 
     def _setup_nicegui(self) -> None:
         """
@@ -514,21 +905,32 @@ class Publisher:
                 # Get ordered registry (depth-first with config classes last)
                 ordered_registry = self._get_ordered_ui_registry()
 
-                # Create tabs for each published class
-                with ui.tabs().classes("w-full") as tabs:
-                    tab_refs = {}
-                    for base_path, registry in ordered_registry:
-                        class_name = registry["class_name"]
-                        tab_refs[class_name] = ui.tab(class_name)
-
-                # Tab panels (use same order as tabs)
+                # One tab and one panel per published class, filled in a single pass;
+                # panels stay empty until first shown
                 first_tab_name = ordered_registry[0][1]["class_name"] if ordered_registry else None
-                with ui.tab_panels(tabs, value=first_tab_name).classes("w-full"):
-                    for base_path, registry in ordered_registry:
-                        class_name = registry["class_name"]
-
-                        with ui.tab_panel(class_name):
-                            await self._render_class_panel(registry)
+                tabs = ui.tabs().classes("w-full")
+                tab_panels = ui.tab_panels(tabs, value=first_tab_name).classes("w-full")
+                panels = {}
+                for base_path, registry in ordered_registry:
+                    class_name = registry["class_name"]
+                    with tabs:
+                        ui.tab(class_name)
+                    with tab_panels:
+                        panels[class_name] = (ui.tab_panel(class_name), registry)
+
+                rendered = set()
+
+                async def ensure_rendered(class_name):
+                    """Render a class panel the first time its tab is shown."""
+                    if class_name in rendered or class_name not in panels:
+                        return
+                    rendered.add(class_name)
+                    panel, registry = panels[class_name]
+                    with panel:
+                        await self._render_class_panel(registry)
+
+                await ensure_rendered(first_tab_name)
+                tab_panels.on_value_change(lambda e: ensure_rendered(e.value))
 
         logger.info("NiceGUI admin interface configured at /admin")
 
@@ -560,43 +962,20 @@ class Publisher:
         Render a button for a method that opens a dialog with form.
 
         Args:
-            method_info: Method metadata and bound method
+            method_info: Method metadata, bound method and render plan
         """
         from nicegui import ui
 
-        method_name = method_info["name"]
+        plan = method_info["plan"]
         description = method_info["description"]
-        parameters = method_info["parameters"]
         bound_method = method_info["bound_method"]
-        http_method = method_info["method"]
+        button_label = plan.label
+        button_color = plan.color
 
-        # Beautify method name: add_shelf -> Add Shelf
-        button_label = method_name.replace("_", " ").title()
-
-        # Choose button color based on HTTP method
-        if http_method == "GET":
-            button_color = "primary"
-        elif method_name.startswith(("add", "create")):
-            button_color = "positive"
-        elif method_name.startswith(("remove", "delete")):
-            button_color = "negative"
-        elif method_name.startswith(("update", "move", "edit")):
-            button_color = "warning"
-        else:
-            button_color = "secondary"
-
-        # Check if method needs dialog or can be executed directly
-        is_destructive = method_name.startswith(("remove", "delete"))
-        has_parameters = bool(parameters)
-        needs_dialog = has_parameters or is_destructive
-
-        if needs_dialog:
+        if plan.needs_dialog:
             def open_method_dialog():
                 """Open dialog with method form."""
                 # Large dialog that floats over the page
-                # Get dialog dimensions from config
-                dialog_height = self.config.get_config("dialog_height") if self.config else "85vh"
-
                 with ui.dialog().classes('resizeable-dialog') as dialog:
                     card = ui.card().classes("w-full max-w-4xl resize-both overflow-auto")
                     with card:
@@ -606,58 +985,18 @@ class Publisher:
                             ui.label(description).classes("text-caption text-grey mb-4")
 
                         # Confirmation message for destructive operations without parameters
-                        if is_destructive and not has_parameters:
+                        if plan.is_destructive and not plan.params:
                             ui.separator()
                             ui.label("Are you sure you want to proceed?").classes("text-warning")
 
                         # Parameters form
                         input_widgets = {}
 
-                        if parameters:
+                        if plan.params:
                             ui.separator()
                             with ui.column().classes("w-full gap-2 mt-2"):
-                                for param_name, param_info in parameters.items():
-                                    param_type = param_info.get("type", "str")
-                                    param_desc = param_info.get("description", "")
-                                    param_required = param_info.get("required", True)
-                                    param_default = param_info.get("default", "")
-
-                                    label_text = param_name.replace("_", " ").title()
-                                    if param_required:
-                                        label_text += " *"
-
-                                    # Create appropriate input based on type
-                                    if param_type in ["str", "string"]:
-                                        input_widgets[param_name] = ui.input(
-                                            label=label_text,
-                                            placeholder=param_desc,
-                                            value=param_default if param_default != "..." else ""
-                                        ).classes("w-full")
-                                    elif param_type in ["int", "integer"]:
-                                        input_widgets[param_name] = ui.number(
-                                            label=label_text,
-                                            placeholder=param_desc,
-                                            value=int(param_default) if param_default and param_default != "..." else None
-                                        ).classes("w-full")
-                                    elif param_type == "float":
-                                        input_widgets[param_name] = ui.number(
-                                            label=label_text,
-                                            placeholder=param_desc,
-                                            value=float(param_default) if param_default and param_default != "..." else None,
-                                            format="%.2f"
-                                        ).classes("w-full")
-                                    elif param_type in ["bool", "boolean"]:
-                                        input_widgets[param_name] = ui.checkbox(
-                                            text=label_text,
-                                            value=bool(param_default) if param_default else False
-                                        )
-                                    else:
-                                        # Default to text input for complex types
-                                        input_widgets[param_name] = ui.input(
-                                            label=f"{label_text} ({param_type})",
-                                            placeholder=param_desc,
-                                            value=str(param_default) if param_default and param_default != "..." else ""
-                                        ).classes("w-full")
+                                for param in plan.params:
+                                    input_widgets[param.name] = param.factory(ui, param)
 
                         ui.separator()
 
@@ -673,17 +1012,15 @@ class Publisher:
 
                             try:
                                 # Collect parameters
-                                kwargs = {}
-                                if parameters:
-                                    for param_name, widget in input_widgets.items():
-                                        value = widget.value
-                                        # Convert empty strings to None for optional parameters
-                                        if value == "" and not parameters[param_name].get("required", True):
-                                            value = None
-                                        kwargs[param_name] = value
+                                kwargs = {
+                                    param.name: param.coerce(input_widgets[param.name].value)
+                                    for param in plan.params
+                                }
 
                                 # Call the method
                                 result = bound_method(**kwargs)
+                                if inspect.isawaitable(result):
+                                    result = await result
 
                                 # Display result
                                 result_container.clear()
@@ -710,8 +1047,9 @@ class Publisher:
             async def execute_directly():
                 """Execute method directly and show result in a dialog."""
                 # Get dialog dimensions from config
-                dialog_width = self.config.get_config("dialog_width") if self.config else "90vw"
-                dialog_height = self.config.get_config("dialog_height") if self.config else "85vh"
+                settings = self.config.get_all_config() if self.config else {}
+                dialog_width = settings.get("dialog_width", "90vw")
+                dialog_height = settings.get("dialog_height", "85vh")
 
                 # Create dialog
                 with ui.dialog().classes('resizeable-dialog') as result_dialog:
@@ -730,6 +1068,8 @@ class Publisher:
                         try:
                             # Call the method
                             result = bound_method()
+                            if inspect.isawaitable(result):
+                                result = await result
 
                             # Display result
                             result_container.clear()
@@ -749,31 +1089,6 @@ class Publisher:
             # Create the button that executes directly
             ui.button(button_label, on_click=execute_directly, color=button_color).classes("w-full")
 
-    def _extract_entity_name(self, method_name: str) -> str:
-        """
-        Extract entity name from method name for display.
-
-        Examples:
-            list_books -> Books
-            list_shelves -> Shelves
-            get_stats -> Stats
-            list_all_books -> Books
-
-        Args:
-            method_name: Method name (e.g., "list_books")
-
-        Returns:
-            Entity name in title case (e.g., "Books")
-        """
-        # Remove common prefixes
-        for prefix in ["list_all_", "list_", "get_all_", "get_"]:
-            if method_name.startswith(prefix):
-                entity = method_name[len(prefix):]
-                return entity.replace("_", " ").title()
-
-        # Fallback to method name
-        return method_name.replace("_", " ").title()
-
     def _render_result(self, result: Any, method_label: str = "") -> None:
         """
         Render the result of a method call in a user-friendly format.
@@ -786,7 +1101,6 @@ class Publisher:
             method_label: Method name for title (e.g., "List Shelves")
         """
         from nicegui import ui
-        from dataclasses import is_dataclass, asdict
 
         if result is None:
             ui.label("Success!").classes("text-green")
@@ -801,8 +1115,9 @@ class Publisher:
                 if isinstance(first_item, dict):
                     rows = result
                 elif is_dataclass(first_item):
-                    # Dataclass objects - convert to dict
-                    rows = [asdict(item) for item in result]
+                    # Dataclass objects - shallow dict of their fields (no deep copy)
+                    field_names = [field.name for field in dataclass_fields(first_item)]
+                    rows = [{name: getattr(item, name) for name in field_names} for item in result]
                 elif hasattr(first_item, '__dict__'):
                     # Objects with __dict__ - convert to dict
                     rows = [item.__dict__ for item in result]
@@ -820,16 +1135,15 @@ class Publisher:
                     title = f"{entity}: {count}"
                     ui.label(title).classes("text-h6 text-center w-full mb-1")
 
+                    # Display label per column, shared by the grid and the row details
+                    display_labels = [(key, key.replace("_", " ").title()) for key in rows[0]]
+
                     # Build column definitions
-                    column_defs = []
-                    for key in rows[0].keys():
-                        column_defs.append({
-                            "headerName": key.replace("_", " ").title(),
-                            "field": key
-                        })
+                    column_defs = [
+                        {"headerName": label, "field": key} for key, label in display_labels
+                    ]
 
-                    # Create AG Grid with autoHeight
-                    grid = ui.aggrid({
+                    grid_options = {
                         "columnDefs": column_defs,
                         "rowData": rows,
                         "defaultColDef": {
@@ -840,7 +1154,14 @@ class Publisher:
                         "domLayout": "autoHeight",  # Auto-adjust height to content
                         "rowSelection": "single",
                         "suppressCellFocus": True
-                    }).classes("ag-theme-quartz")
+                    }
+                    # Long results: render one page of rows at a time
+                    if count > _GRID_PAGE_SIZE:
+                        grid_options["pagination"] = True
+                        grid_options["paginationPageSize"] = _GRID_PAGE_SIZE
+
+                    # Create AG Grid with autoHeight
+                    grid = ui.aggrid(grid_options).classes("ag-theme-quartz")
 
                     # Detail container for showing selected row details
                     detail_container = ui.column().classes("mt-3 w-full")
@@ -854,11 +1175,11 @@ class Publisher:
                             with detail_container:
                                 with ui.card().classes('p-3 w-full').style('max-width: 800px'):
                                     # Build markdown for selected row
-                                    md_lines = []
-                                    for key, value in row.items():
-                                        label = key.replace("_", " ").title()
-                                        md_lines.append(f"**{label}:** {value}")
-                                    ui.markdown("\n\n".join(md_lines))
+                                    ui.markdown("\n\n".join(
+                                        f"**{label}:** {row[key]}"
+                                        for key, label in display_labels
+                                        if key in row
+                                    ))
                 else:
                     # Simple list - render as items
                     with ui.column().classes("w-full"):
@@ -873,16 +1194,19 @@ class Publisher:
         """
         Render a card for a single method with dynamic form.
 
+        The form is built from the method's render plan, so labels, widgets
+        and typed defaults are resolved once at registration, not per render.
+
         Args:
-            method_info: Method metadata and bound method
+            method_info: Method metadata, bound method and render plan
         """
         from nicegui import ui
 
         method_name = method_info["name"]
         description = method_info["description"]
-        parameters = method_info["parameters"]
         bound_method = method_info["bound_method"]
         http_method = method_info["method"]
+        plan = method_info["plan"]
 
         # Method card
         with ui.card().classes("w-full"):
@@ -896,54 +1220,16 @@ class Publisher:
 
             ui.separator()
 
+            # Store input widgets
+            input_widgets = {}
+
             # Parameters form
-            if parameters:
+            if plan.params:
                 ui.label("Parameters:").classes("text-subtitle2 mt-2")
 
-                # Store input widgets
-                input_widgets = {}
-
                 with ui.column().classes("w-full gap-2 mt-2"):
-                    for param_name, param_info in parameters.items():
-                        param_type = param_info.get("type", "str")
-                        param_desc = param_info.get("description", "")
-                        param_required = param_info.get("required", True)
-                        param_default = param_info.get("default", "")
-
-                        label_text = param_name
-                        if param_required:
-                            label_text += " *"
-                        if param_desc:
-                            label_text += f" - {param_desc}"
-
-                        # Create appropriate input based on type
-                        if param_type in ["str", "string"]:
-                            input_widgets[param_name] = ui.input(
-                                label=label_text,
-                                value=param_default if param_default != "..." else ""
-                            ).classes("w-full")
-                        elif param_type in ["int", "integer"]:
-                            input_widgets[param_name] = ui.number(
-                                label=label_text,
-                                value=int(param_default) if param_default and param_default != "..." else None
-                            ).classes("w-full")
-                        elif param_type == "float":
-                            input_widgets[param_name] = ui.number(
-                                label=label_text,
-                                value=float(param_default) if param_default and param_default != "..." else None,
-                                format="%.2f"
-                            ).classes("w-full")
-                        elif param_type in ["bool", "boolean"]:
-                            input_widgets[param_name] = ui.checkbox(
-                                text=label_text,
-                                value=bool(param_default) if param_default else False
-                            )
-                        else:
-                            # Default to text input for complex types
-                            input_widgets[param_name] = ui.input(
-                                label=f"{label_text} ({param_type})",
-                                value=str(param_default) if param_default and param_default != "..." else ""
-                            ).classes("w-full")
+                    for param in plan.params:
+                        input_widgets[param.name] = param.factory(ui, param)
 
             # Result container
             result_container = ui.column().classes("w-full mt-4")
@@ -959,17 +1245,15 @@ class Publisher:
 
                 try:
                     # Collect parameters
-                    kwargs = {}
-                    if parameters:
-                        for param_name, widget in input_widgets.items():
-                            value = widget.value
-                            # Convert empty strings to None for optional parameters
-                            if value == "" and not parameters[param_name].get("required", True):
-                                value = None
-                            kwargs[param_name] = value
+                    kwargs = {
+                        param.name: param.coerce(input_widgets[param.name].value)
+                        for param in plan.params
+                    }
 
                     # Call the method
                     result = bound_method(**kwargs)
+                    if inspect.isawaitable(result):
+                        result = await result
 
                     # Display result
                     result_container.clear()
@@ -1051,8 +1335,9 @@ class Publisher:
 
         if db_conn is None:
             logger.warning(
-                f"Transaction requested but no database connection found on {type(instance).__name__}. "
-                f"Executing without transaction."
+                "Transaction requested but no database connection found on %s. "
+                "Executing without transaction.",
+                type(instance).__name__,
             )
             return bound_method(**kwargs)
 
@@ -1071,7 +1356,7 @@ class Publisher:
             raise
 
     def _create_endpoint(
-        self, router: APIRouter, instance: object, endpoint_info: dict[str, Any]
+        self, router: APIRouter, instance: object, spec: _EndpointSpec
     ) -> None:
         """
         Create a FastAPI endpoint from metadata.
@@ -1079,186 +1364,115 @@ class Publisher:
         Args:
             router: APIRouter to add the endpoint to
             instance: Instance containing the method
-            endpoint_info: Endpoint metadata from introspection
-
-        Endpoint info structure:
-            {
-                "function_name": str,
-                "path": str,
-                "method": str (GET/POST),
-                "parameters": dict,  # {param_name: {type, required, default, description}}
-                "return_type": dict,  # {type, description}
-                "description": str,
-                "transaction": bool  # Whether to execute in a transaction
-            }
+            spec: Endpoint metadata from introspection
         """
-        func_name = endpoint_info["function_name"]
-        path = endpoint_info["path"]
-        method = endpoint_info["method"]
-        params = endpoint_info.get("parameters", {})
-        return_type_info = endpoint_info.get("return_type", {})
-        description = endpoint_info.get("description", "")
-        needs_transaction = endpoint_info.get("transaction", False)
+        func_name = spec.func_name
+        method = spec.method
+        params = spec.params
 
         # Get the bound method from instance
-        if not hasattr(instance, func_name):
-            logger.error(f"Method {func_name} not found on instance")
+        try:
+            bound_method = getattr(instance, func_name)
+        except AttributeError:
+            logger.error("Method %s not found on instance", func_name)
             return
 
-        bound_method = getattr(instance, func_name)
-
-        # Create Pydantic model for request parameters if any
-        request_model = None
+        # Create Pydantic model (and GET signature) for request parameters if any
+        request_model = get_signature = None
         if params:
-            # Build field definitions for Pydantic
-            fields = {}
-            for param_name, param_info in params.items():
-                param_type_str = param_info.get("type", "Any")
-                param_required = param_info.get("required", True)
-                param_default = param_info.get("default", ...)
-                param_desc = param_info.get("description", "")
-
-                # Map type string to Python type
-                field_type = self._map_type_string(param_type_str)
-
-                # Set default value
-                if not param_required:
-                    if param_default == "":
-                        fields[param_name] = (field_type, "")
-                    elif param_default == "None" or param_default is None:
-                        fields[param_name] = (field_type | None, None)
-                    else:
-                        fields[param_name] = (field_type, param_default)
-                else:
-                    fields[param_name] = (field_type, ...)
-
-            # Create dynamic Pydantic model
-            model_name = f"{func_name.title()}Request"
-            request_model = create_model(model_name, **fields)
-
-        # Create the endpoint handler
-        if method == "GET":
-            # For GET, parameters come from query string
-            if request_model:
-                # Create a function with proper signature for FastAPI
-                # We need to dynamically create parameters with Query() defaults
-                def make_get_handler():
-                    # Build parameters for the function signature
-                    sig_params = []
-                    for param_name, param_info in params.items():
-                        param_type_str = param_info.get("type", "Any")
-                        param_required = param_info.get("required", True)
-                        param_default = param_info.get("default", ...)
-
-                        # Map type string to Python type
-                        field_type = self._map_type_string(param_type_str)
-
-                        # Create inspect.Parameter with Query() annotation
-                        if param_required:
-                            default_value = Query(...)
-                        else:
-                            if param_default == "None" or param_default is None:
-                                default_value = Query(None)
-                            elif param_default == "":
-                                default_value = Query("")
-                            else:
-                                default_value = Query(param_default)
-
-                        sig_params.append(
-                            inspect.Parameter(
-                                param_name,
-                                inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                                default=default_value,
-                                annotation=field_type
-                            )
-                        )
-
-                    # Create async function with the right signature
-                    async def endpoint_handler(**kwargs):
-                        try:
-                            result = bound_method(**kwargs)
-                            return result
-                        except Exception as e:
-                            logger.error(f"Error in {func_name}: {e}")
-                            raise HTTPException(status_code=500, detail=str(e))
-
-                    # Apply the signature
-                    endpoint_handler.__signature__ = inspect.Signature(sig_params)
-                    return endpoint_handler
-
-                handler = make_get_handler()
-
-                # Add route
-                router.add_api_route(
-                    path,
-                    handler,
-                    methods=["GET"],
-                    summary=func_name,
-                    description=description,
-                    response_model=None,
+            fields = tuple(
+                (
+                    param_name,
+                    self._map_type_string(param_info.get("type", "Any")),
+                    param_info.get("required", True),
+                    param_info.get("default", ...),
                 )
-            else:
-                # No parameters
-                async def endpoint_handler():
-                    try:
-                        result = bound_method()
-                        return result
-                    except Exception as e:
-                        logger.error(f"Error in {func_name}: {e}")
-                        raise HTTPException(status_code=500, detail=str(e))
-
-                router.add_api_route(
-                    path,
-                    endpoint_handler,
-                    methods=["GET"],
-                    summary=func_name,
-                    description=description,
-                    response_model=None,
+                for param_name, param_info in params.items()
+            )
+            try:
+                request_model, get_signature = _build_request_spec(func_name, fields)
+            except TypeError:
+                # Unhashable default value: build without the cache
+                request_model, get_signature = _build_request_spec.__wrapped__(
+                    func_name, fields
                 )
 
-        elif method == "POST":
-            # For POST, parameters come from request body
-            if request_model:
-                async def endpoint_handler(request: request_model):  # type: ignore
-                    try:
-                        # Convert Pydantic model to dict
-                        kwargs = request.model_dump()
-                        result = bound_method(**kwargs)
-                        return result
-                    except Exception as e:
-                        logger.error(f"Error in {func_name}: {e}")
-                        raise HTTPException(status_code=500, detail=str(e))
-
-                router.add_api_route(
-                    path,
-                    endpoint_handler,
-                    methods=["POST"],
-                    summary=func_name,
-                    description=description,
-                    response_model=None,
-                )
-            else:
-                # No parameters
-                async def endpoint_handler():
-                    try:
-                        result = bound_method()
-                        return result
-                    except Exception as e:
-                        logger.error(f"Error in {func_name}: {e}")
-                        raise HTTPException(status_code=500, detail=str(e))
-
-                router.add_api_route(
-                    path,
-                    endpoint_handler,
-                    methods=["POST"],
-                    summary=func_name,
-                    description=description,
-                    response_model=None,
+        if method not in ("GET", "POST"):
+            logger.warning("Unsupported HTTP method %s for %s", method, func_name)
+            return
+
+        # Create the endpoint handler and add the route
+        handler = self._build_handler(
+            method, bound_method, func_name, request_model, get_signature
+        )
+        router.add_api_route(
+            spec.path,
+            handler,
+            methods=[method],
+            summary=func_name,
+            description=spec.description,
+            response_model=None,
+        )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Created %s endpoint: %s", method, spec.path)
+
+    def _build_handler(
+        self,
+        method: str,
+        bound_method: callable,
+        func_name: str,
+        request_model: type[BaseModel] | None,
+        get_signature: inspect.Signature | None,
+    ) -> callable:
+        """
+        Build the FastAPI handler calling a published method.
+
+        One coroutine serves every case; its __signature__ tells FastAPI where
+        parameters come from: query string (GET), a JSON body validated by
+        request_model (POST), or nothing.
+
+        Args:
+            method: HTTP method (GET/POST)
+            bound_method: The method to call
+            func_name: Method name, for error logging
+            request_model: Pydantic model for the parameters, None if there are none
+            get_signature: Signature with Query() defaults, used for GET
+
+        Returns:
+            Async endpoint handler
+        """
+        from_body = request_model is not None and method != "GET"
+
+        async def endpoint_handler(**kwargs):
+            try:
+                if from_body:
+                    # Field values as validated; request models never nest other models
+                    kwargs = dict(kwargs["request"])
+                result = bound_method(**kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+            except Exception as e:
+                logger.error("Error in %s: %s", func_name, e)
+                raise HTTPException(status_code=500, detail=str(e))
+
+        if request_model is None:
+            endpoint_handler.__signature__ = inspect.Signature()
+        elif from_body:
+            endpoint_handler.__signature__ = inspect.Signature([
+                inspect.Parameter(
+                    "request", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=request_model
                 )
+            ])
+        else:
+            endpoint_handler.__signature__ = get_signature
 
-        logger.debug(f"Created {method} endpoint: {path}")
+        return endpoint_handler
 
-    def _map_type_string(self, type_str: str) -> type:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _map_type_string(type_str: str) -> type:
         """
         Map type string from introspection to Python type.
 
@@ -1268,23 +1482,22 @@ class Publisher:
         Returns:
             Python type object
         """
-        # Basic types
-        type_mapping = {
-            "str": str,
-            "int": int,
-            "float": float,
-            "bool": bool,
-            "dict": dict,
-            "list": list,
-            "Any": Any,
-        }
-
         # Try direct mapping first
-        if type_str in type_mapping:
-            return type_mapping[type_str]
+        if type_str in _TYPE_MAPPING:
+            return _TYPE_MAPPING[type_str]
+
+        # Handle complex types (list[str], dict[str, int], Optional[int], etc.)
+        match = _COMPLEX_RE.match(type_str.strip())
+        if match:
+            origin, inner = match.groups()
+            args = tuple(
+                ... if arg == "..." else Publisher._map_type_string(arg)
+                for arg in _split_type_args(inner)
+            )
+            if origin == "Optional":
+                return args[0] | None
+            return _GENERIC_ORIGINS[origin][args if len(args) > 1 else args[0]]
 
-        # Handle complex types (list[str], dict[str, int], etc.)
-        # For now, just return Any for complex types
-        # TODO: Parse complex type strings properly
-        logger.debug(f"Complex type {type_str} mapped to Any")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Complex type %s mapped to Any", type_str)
         return Any
@@ -1,13 +1,23 @@
 """Library management system for testing Publisher."""
 
 import sqlite3
+import threading
 from dataclasses import dataclass, field
-from typing import Annotated, Any
+from typing import Annotated, Any, Iterator
 
 from genro_core.decorators import apiready
 
+# Column order of every "SELECT id, title, ... FROM books" query
+BOOK_COLUMNS = ("id", "title", "author", "publisher", "pages", "genre", "shelf_code")
 
-@dataclass
+
+def _iter_rows(cursor: sqlite3.Cursor, chunk: int = 1000) -> Iterator[Any]:
+    """Yield rows from an executed cursor, fetching them in chunks."""
+    while rows := cursor.fetchmany(chunk):
+        yield from rows
+
+
+@dataclass(slots=True, frozen=True)
 class Shelf:
     """Simple shelf data class."""
     code: str
@@ -52,6 +62,11 @@ class ShelfManager:
 class Book:
     """Book in the library with API methods."""
 
+    __slots__ = (
+        "id", "title", "author", "publisher", "pages", "genre", "shelf_code",
+        "_library", "_content",
+    )
+
     def __init__(
         self,
         id: int,
@@ -75,7 +90,7 @@ class Book:
             genre: Book genre
             shelf_code: Shelf where book is located
             library: Reference to Library instance
-            content: Optional page content dictionary
+            content: Optional page content dictionary (loaded lazily if omitted)
         """
         self.id = id
         self.title = title
@@ -85,7 +100,18 @@ class Book:
         self.genre = genre
         self.shelf_code = shelf_code
         self._library = library
-        self.content = content or {}
+        self._content = content
+
+    @property
+    def content(self) -> dict[int, str]:
+        """Page content dictionary, loaded from the library on first access."""
+        self._ensure_content()
+        return self._content
+
+    def _ensure_content(self) -> None:
+        """Load page content once; metadata-only callers never pay for it."""
+        if self._content is None:
+            self._content = self._library._fetch_content(self.id)
 
     @apiready
     def get_page(
@@ -142,27 +168,79 @@ class Library:
             db_path: Path to SQLite database file. Use ":memory:" for in-memory database.
         """
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        # Per-thread connections of a file database, keyed by thread id
+        self._connections: dict[int, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
+
+        # An in-memory database lives in its connection, so it must be shared;
+        # file databases get one connection per thread (WAL allows concurrent readers)
+        self._shared_conn = self._connect() if db_path == ":memory:" else None
         self._create_tables()
 
         # Create shelf manager (will be discovered by eager introspection)
         self.shelf = ShelfManager(self)
 
+    def _has_legacy_book_content(self) -> bool:
+        """Check for a book_content table created before WITHOUT ROWID was used."""
+        row = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'book_content'"
+        ).fetchone()
+        return row is not None and "WITHOUT ROWID" not in row[0].upper()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Database connection for the calling thread."""
+        if self._shared_conn is not None:
+            return self._shared_conn
+
+        thread_id = threading.get_ident()
+        conn = self._connections.get(thread_id)
+        if conn is None:
+            conn = self._connect()
+            with self._connections_lock:
+                self._connections[thread_id] = conn
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new database connection."""
+        # Room in sqlite3's prepared-statement cache for every query used here
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=256
+        )
+        self._configure_pragmas(conn)
+        return conn
+
+    def _configure_pragmas(self, conn: sqlite3.Connection) -> None:
+        """Tune SQLite for write throughput and concurrent readers."""
+        pragmas = [
+            "PRAGMA synchronous=NORMAL;",
+            "PRAGMA temp_store=MEMORY;",
+            "PRAGMA cache_size=-65536;",  # 64 MiB
+            "PRAGMA mmap_size=268435456;",
+            "PRAGMA foreign_keys=ON;",  # Required for ON DELETE CASCADE
+        ]
+        # WAL is not available for in-memory databases
+        if self.db_path != ":memory:":
+            pragmas.insert(0, "PRAGMA journal_mode=WAL;")
+        conn.executescript("\n".join(pragmas))
+
     def _create_tables(self) -> None:
         """Create database tables if they don't exist."""
-        cursor = self.conn.cursor()
+        # A legacy rowid book_content is moved aside and copied into the new table
+        legacy_content = self._has_legacy_book_content()
+
+        script = ["BEGIN;"]
+        if legacy_content:
+            script.append("ALTER TABLE book_content RENAME TO book_content_legacy;")
 
-        # Shelves table
-        cursor.execute("""
+        script.append("""
+            -- Shelves table
             CREATE TABLE IF NOT EXISTS shelves (
                 code TEXT PRIMARY KEY,
                 name TEXT NOT NULL
-            )
-        """)
+            );
 
-        # Books table
-        cursor.execute("""
+            -- Books table
             CREATE TABLE IF NOT EXISTS books (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 title TEXT NOT NULL,
@@ -172,51 +250,75 @@ class Library:
                 genre TEXT NOT NULL,
                 shelf_code TEXT NOT NULL,
                 FOREIGN KEY (shelf_code) REFERENCES shelves(code)
-            )
-        """)
+            );
 
-        # Book content table
-        cursor.execute("""
+            -- Book content table, clustered on its primary key (no separate rowid)
             CREATE TABLE IF NOT EXISTS book_content (
                 book_id INTEGER NOT NULL,
                 page_number INTEGER NOT NULL,
                 content TEXT NOT NULL,
                 PRIMARY KEY (book_id, page_number),
                 FOREIGN KEY (book_id) REFERENCES books(id) ON DELETE CASCADE
-            )
+            ) WITHOUT ROWID;
+
+            -- Lookup indexes (book_content is already keyed by book_id first);
+            -- (shelf_code, title) serves list_books_by_shelf in ORDER BY order
+            DROP INDEX IF EXISTS idx_books_shelf;
+            CREATE INDEX IF NOT EXISTS idx_books_shelf_title ON books(shelf_code, title);
+            CREATE INDEX IF NOT EXISTS idx_books_genre ON books(genre COLLATE NOCASE);
         """)
 
-        self.conn.commit()
+        if legacy_content:
+            script.append("""
+                INSERT INTO book_content (book_id, page_number, content)
+                SELECT book_id, page_number, content FROM book_content_legacy
+                -- Pages of deleted books were left behind without foreign_keys
+                WHERE book_id IN (SELECT id FROM books);
+                DROP TABLE book_content_legacy;
+            """)
 
-    def _row_to_shelf(self, row: sqlite3.Row) -> Shelf:
-        """Convert database row to Shelf object."""
-        return Shelf(code=row["code"], name=row["name"])
+        script.append("COMMIT;")
 
-    def _row_to_book(self, row: sqlite3.Row) -> Book:
-        """Convert database row to Book object."""
-        # Load page content for this book
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT page_number, content FROM book_content WHERE book_id = ?",
-            (row["id"],),
-        )
-        content = {row["page_number"]: row["content"] for row in cursor.fetchall()}
+        # One parser invocation for the whole DDL batch
+        self.conn.executescript("\n".join(script))
+
+    def _row_to_shelf(self, row: tuple) -> Shelf:
+        """Convert a (code, name) row to Shelf object."""
+        code, name = row
+        return Shelf(code=code, name=name)
 
+    def _row_to_book(self, row: tuple) -> Book:
+        """Convert a row in BOOK_COLUMNS order to Book object (content is loaded lazily)."""
+        id_, title, author, publisher, pages, genre, shelf_code = row
         return Book(
-            id=row["id"],
-            title=row["title"],
-            author=row["author"],
-            publisher=row["publisher"],
-            pages=row["pages"],
-            genre=row["genre"],
-            shelf_code=row["shelf_code"],
+            id=id_,
+            title=title,
+            author=author,
+            publisher=publisher,
+            pages=pages,
+            genre=genre,
+            shelf_code=shelf_code,
             library=self,
-            content=content,
         )
 
+    def _fetch_content(self, book_id: int) -> dict[int, str]:
+        """Load all page content of a book."""
+        cursor = self.conn.execute(
+            "SELECT page_number, content FROM book_content WHERE book_id = ?",
+            (book_id,),
+        )
+        return dict(cursor.fetchall())
+
     def close(self) -> None:
-        """Close database connection."""
-        self.conn.close()
+        """Close all database connections."""
+        if self._shared_conn is not None:
+            self._shared_conn.close()
+
+        # Dropping the entries makes every thread open a fresh connection next time
+        with self._connections_lock:
+            for conn in self._connections.values():
+                conn.close()
+            self._connections.clear()
 
     # ========== SHELF MANAGEMENT ==========
 
@@ -243,24 +345,33 @@ class Library:
         """Remove a shelf from the library."""
         cursor = self.conn.cursor()
 
-        # Check if shelf exists
-        cursor.execute("SELECT code FROM shelves WHERE code = ?", (code,))
-        if not cursor.fetchone():
-            raise KeyError(f"Shelf '{code}' not found")
-
-        # Check if shelf has books
+        # Delete only if the shelf is empty
         cursor.execute(
-            "SELECT COUNT(*) as count FROM books WHERE shelf_code = ?", (code,)
+            """
+            DELETE FROM shelves
+            WHERE code = ? AND NOT EXISTS (SELECT 1 FROM books WHERE shelf_code = ?)
+        """,
+            (code, code),
         )
-        count = cursor.fetchone()["count"]
-        if count > 0:
+        self.conn.commit()
+
+        if cursor.rowcount == 0:
+            # Nothing deleted: find out whether the shelf is missing or not empty
+            cursor.execute(
+                """
+                SELECT
+                    EXISTS (SELECT 1 FROM shelves WHERE code = ?),
+                    (SELECT COUNT(*) FROM books WHERE shelf_code = ?)
+            """,
+                (code, code),
+            )
+            exists, count = cursor.fetchone()
+            if not exists:
+                raise KeyError(f"Shelf '{code}' not found")
             raise ValueError(
                 f"Cannot remove shelf '{code}': it contains {count} books"
             )
 
-        cursor.execute("DELETE FROM shelves WHERE code = ?", (code,))
-        self.conn.commit()
-
     @apiready
     def list_shelves(self) -> list[Shelf]:
         """List all shelves in the library."""
@@ -295,21 +406,20 @@ class Library:
         """Add a new book to the library."""
         cursor = self.conn.cursor()
 
-        # Validate shelf exists
-        cursor.execute("SELECT code FROM shelves WHERE code = ?", (shelf_code,))
-        if not cursor.fetchone():
-            raise KeyError(f"Shelf '{shelf_code}' not found")
-
-        # Insert book
+        # Insert book only if the shelf exists
         cursor.execute(
             """
             INSERT INTO books (title, author, publisher, pages, genre, shelf_code)
-            VALUES (?, ?, ?, ?, ?, ?)
+            SELECT ?, ?, ?, ?, ?, ?
+            WHERE EXISTS (SELECT 1 FROM shelves WHERE code = ?)
         """,
-            (title, author, publisher, pages, genre, shelf_code),
+            (title, author, publisher, pages, genre, shelf_code, shelf_code),
         )
         self.conn.commit()
 
+        if cursor.rowcount == 0:
+            raise KeyError(f"Shelf '{shelf_code}' not found")
+
         book_id = cursor.lastrowid
         return Book(
             id=book_id,
@@ -327,15 +437,13 @@ class Library:
         """Remove a book from the library."""
         cursor = self.conn.cursor()
 
-        # Check if book exists
-        cursor.execute("SELECT id FROM books WHERE id = ?", (book_id,))
-        if not cursor.fetchone():
-            raise KeyError(f"Book with ID {book_id} not found")
-
         # Delete book (content is deleted via CASCADE)
         cursor.execute("DELETE FROM books WHERE id = ?", (book_id,))
         self.conn.commit()
 
+        if cursor.rowcount == 0:
+            raise KeyError(f"Book with ID {book_id} not found")
+
     @apiready
     def get_book(self, book_id: Annotated[int, "Book ID"]) -> Book:
         """Get a book by its ID."""
@@ -363,22 +471,23 @@ class Library:
         """Move a book to a different shelf."""
         cursor = self.conn.cursor()
 
-        # Check if book exists
-        cursor.execute("SELECT id FROM books WHERE id = ?", (book_id,))
-        if not cursor.fetchone():
-            raise KeyError(f"Book with ID {book_id} not found")
-
-        # Check if new shelf exists
-        cursor.execute("SELECT code FROM shelves WHERE code = ?", (new_shelf_code,))
-        if not cursor.fetchone():
-            raise KeyError(f"Shelf '{new_shelf_code}' not found")
-
-        # Update book shelf
+        # Update book shelf only if the new shelf exists
         cursor.execute(
-            "UPDATE books SET shelf_code = ? WHERE id = ?", (new_shelf_code, book_id)
+            """
+            UPDATE books SET shelf_code = ?
+            WHERE id = ? AND EXISTS (SELECT 1 FROM shelves WHERE code = ?)
+        """,
+            (new_shelf_code, book_id, new_shelf_code),
         )
         self.conn.commit()
 
+        if cursor.rowcount == 0:
+            # Nothing updated: find out whether the book or the shelf is missing
+            cursor.execute("SELECT 1 FROM books WHERE id = ?", (book_id,))
+            if not cursor.fetchone():
+                raise KeyError(f"Book with ID {book_id} not found")
+            raise KeyError(f"Shelf '{new_shelf_code}' not found")
+
         return self.get_book(book_id)
 
     # ========== BOOK QUERIES ==========
@@ -405,18 +514,7 @@ class Library:
         )
 
         # Return dictionaries to avoid serialization issues with Book objects
-        return [
-            {
-                "id": row[0],
-                "title": row[1],
-                "author": row[2],
-                "publisher": row[3],
-                "pages": row[4],
-                "genre": row[5],
-                "shelf_code": row[6],
-            }
-            for row in cursor.fetchall()
-        ]
+        return [dict(zip(BOOK_COLUMNS, row)) for row in _iter_rows(cursor)]
 
     @apiready
     def list_books_by_genre(self, genre: Annotated[str, "Book genre"]) -> list[Book]:
@@ -425,7 +523,7 @@ class Library:
         cursor.execute(
             """
             SELECT id, title, author, publisher, pages, genre, shelf_code
-            FROM books WHERE LOWER(genre) = LOWER(?)
+            FROM books WHERE genre = ? COLLATE NOCASE
             ORDER BY title
         """,
             (genre,),
@@ -442,7 +540,7 @@ class Library:
         cursor.execute(
             """
             SELECT id, title, author, publisher, pages, genre, shelf_code
-            FROM books WHERE LOWER(author) LIKE LOWER(?)
+            FROM books WHERE author LIKE ?
             ORDER BY title
         """,
             (f"%{author}%",),
@@ -453,6 +551,11 @@ class Library:
     @apiready
     def list_all_books(self) -> list[dict]:
         """List all books in the library."""
+        # Return dictionaries to avoid serialization issues with Book objects
+        return list(self.iter_all_books())
+
+    def iter_all_books(self) -> Iterator[dict]:
+        """Iterate over all books as dictionaries, for streaming consumers."""
         cursor = self.conn.cursor()
         cursor.execute(
             """
@@ -462,19 +565,8 @@ class Library:
         """
         )
 
-        # Return dictionaries to avoid serialization issues with Book objects
-        return [
-            {
-                "id": row[0],
-                "title": row[1],
-                "author": row[2],
-                "publisher": row[3],
-                "pages": row[4],
-                "genre": row[5],
-                "shelf_code": row[6],
-            }
-            for row in cursor.fetchall()
-        ]
+        for row in _iter_rows(cursor):
+            yield dict(zip(BOOK_COLUMNS, row))
 
     # ========== BOOK CONTENT ==========
 
@@ -494,20 +586,49 @@ class Library:
         if not row:
             raise KeyError(f"Book with ID {book_id} not found")
 
-        pages = row["pages"]
+        pages = row[0]
         if page_number < 1 or page_number > pages:
             raise ValueError(f"Page number must be between 1 and {pages}")
 
-        # Get page content
+        content = self._fetch_page(book_id, page_number)
+        if content is None:
+            return "[Page content not available]"
+        return content
+
+    def _fetch_page(self, book_id: int, page_number: int) -> str | None:
+        """Fetch stored page content without validating the page number."""
+        cursor = self.conn.cursor()
         cursor.execute(
             "SELECT content FROM book_content WHERE book_id = ? AND page_number = ?",
             (book_id, page_number),
         )
         row = cursor.fetchone()
+        return row[0] if row else None
+
+    @apiready
+    def add_pages(
+        self,
+        book_id: Annotated[int, "Book ID"],
+        pages: Annotated[dict[int, str], "Content by page number"],
+    ) -> None:
+        """
+        Store the content of several pages of a book.
 
-        if row:
-            return row["content"]
-        return "[Page content not available]"
+        All pages are written with a single executemany in one transaction;
+        prefer this over inserting pages one at a time. Existing pages are replaced.
+        """
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO book_content (book_id, page_number, content)
+                    VALUES (?, ?, ?)
+                """,
+                    [(book_id, page_number, content) for page_number, content in pages.items()],
+                )
+        except sqlite3.IntegrityError:
+            # Foreign key on book_content.book_id
+            raise KeyError(f"Book with ID {book_id} not found")
 
     @apiready
     def read_book(
@@ -530,7 +651,7 @@ class Library:
         if not row:
             raise KeyError(f"Book with ID {book_id} not found")
 
-        pages = row["pages"]
+        pages = row[0]
         if to_page is None:
             to_page = pages
 
@@ -540,12 +661,22 @@ class Library:
         if to_page < from_page or to_page > pages:
             raise ValueError(f"End page must be between {from_page} and {pages}")
 
-        # Get all page content in range
-        result = {}
-        for page in range(from_page, to_page + 1):
-            result[page] = self.get_page_content(book_id, page)
+        # Get all page content in range with a single query
+        cursor.execute(
+            """
+            SELECT page_number, content FROM book_content
+            WHERE book_id = ? AND page_number BETWEEN ? AND ?
+            ORDER BY page_number
+        """,
+            (book_id, from_page, to_page),
+        )
+        stored = dict(cursor.fetchall())  # page_number -> content
 
-        return result
+        # Keep page order and fill pages without stored content
+        return {
+            page: stored.get(page, "[Page content not available]")
+            for page in range(from_page, to_page + 1)
+        }
 
     # ========== STATISTICS ==========
 
@@ -554,21 +685,17 @@ class Library:
         """Get library statistics."""
         cursor = self.conn.cursor()
 
-        # Count shelves
-        cursor.execute("SELECT COUNT(*) as count FROM shelves")
-        total_shelves = cursor.fetchone()["count"]
-
-        # Count books
-        cursor.execute("SELECT COUNT(*) as count FROM books")
-        total_books = cursor.fetchone()["count"]
-
-        # Sum pages
-        cursor.execute("SELECT SUM(pages) as total FROM books")
-        total_pages = cursor.fetchone()["total"] or 0
-
-        # Count genres
-        cursor.execute("SELECT COUNT(DISTINCT genre) as count FROM books")
-        total_genres = cursor.fetchone()["count"]
+        # All aggregates in a single round-trip
+        cursor.execute(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM shelves),
+                (SELECT COUNT(*) FROM books),
+                (SELECT COALESCE(SUM(pages), 0) FROM books),
+                (SELECT COUNT(DISTINCT genre) FROM books)
+        """
+        )
+        total_shelves, total_books, total_pages, total_genres = cursor.fetchone()
 
         return {
             "total_shelves": total_shelves,
@@ -581,5 +708,5 @@ class Library:
     def get_genres(self) -> list[str]:
         """Get list of all genres in the library."""
         cursor = self.conn.cursor()
-        cursor.execute("SELECT genre FROM books GROUP BY genre ORDER BY genre")
-        return [row["genre"] for row in cursor.fetchall()]
+        cursor.execute("SELECT DISTINCT genre FROM books ORDER BY genre")
+        return [row[0] for row in cursor.fetchall()]
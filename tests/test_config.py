@@ -0,0 +1,89 @@
+"""Test PublisherConfig persistence and its read cache."""
+
+import pytest
+from genro_api.config import DialogSizeConfig, PublisherConfig
+
+
+@pytest.fixture
+def config():
+    """Create an in-memory configuration."""
+    cfg = PublisherConfig(":memory:")
+    yield cfg
+    cfg.close()
+
+
+def test_set_config_is_visible_to_reads(config):
+    """A single set is served by get_config and list_all_config."""
+    config.set_config("dialog_width", "50vw")
+
+    assert config.get_config("dialog_width") == "50vw"
+    assert {"key": "dialog_width", "value": "50vw"} in config.list_all_config()
+
+
+def test_bulk_set_is_visible_to_reads(config):
+    """Both values of a bulk write are served after it, even with a listing cached."""
+    config.list_all_config()
+    config.set_dialog_size(DialogSizeConfig(width="60vw", height="40vh"))
+
+    assert config.get_config("dialog_width") == "60vw"
+    assert config.get_config("dialog_height") == "40vh"
+    listing = {item["key"]: item["value"] for item in config.list_all_config()}
+    assert listing["dialog_width"] == "60vw"
+    assert listing["dialog_height"] == "40vh"
+
+
+def test_reset_to_defaults_is_visible_to_reads(config):
+    """reset_to_defaults overwrites changed values in the cache as well."""
+    config.set_config("grid_show_borders", "false")
+    config.list_all_config()
+    config.reset_to_defaults()
+
+    assert config.get_config("grid_show_borders") == "true"
+    listing = {item["key"]: item["value"] for item in config.list_all_config()}
+    assert listing == PublisherConfig.DEFAULTS
+
+
+def test_cache_matches_database(tmp_path):
+    """Values written through the cache are read back by a new instance."""
+    db_path = str(tmp_path / "config.db")
+    cfg = PublisherConfig(db_path)
+    cfg.set_config("dialog_width", "70vw")
+    cfg.close()
+
+    cfg = PublisherConfig(db_path)
+    try:
+        assert cfg.get_config("dialog_width") == "70vw"
+    finally:
+        cfg.close()
+
+
+def test_get_all_config(config):
+    """get_all_config returns defaults merged with overridden values."""
+    assert config.get_all_config() == PublisherConfig.DEFAULTS
+
+    config.set_config("dialog_height", "50vh")
+    config.set_config("custom_key", "custom")
+
+    assert config.get_all_config() == {
+        **PublisherConfig.DEFAULTS,
+        "dialog_height": "50vh",
+        "custom_key": "custom",
+    }
+
+
+def test_get_all_config_returns_a_copy(config):
+    """Mutating the returned mapping does not touch the stored configuration."""
+    config.get_all_config()["dialog_width"] = "1px"
+
+    assert config.get_config("dialog_width") == "90vw"
+
+
+def test_list_all_config_returns_copies(config):
+    """Mutating a returned listing does not leak into later calls."""
+    listing = config.list_all_config()
+    listing[0]["value"] = "changed"
+    listing.append({"key": "extra", "value": "x"})
+
+    assert config.list_all_config() == [
+        {"key": key, "value": value} for key, value in sorted(PublisherConfig.DEFAULTS.items())
+    ]
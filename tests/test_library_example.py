@@ -0,0 +1,138 @@
+"""Test the example Library application."""
+
+import csv
+import io
+import sqlite3
+
+import pytest
+from examples.Library.library_code.library_manager import Library, _csv_columns
+
+
+@pytest.fixture
+def library():
+    """Create example library loaded with the bundled CSV data."""
+    lib = Library(":memory:")
+    lib.import_from_csv()
+    yield lib
+    lib.close()
+
+
+def _book_ids_by_author(book_table, author):
+    """Ids of the books list_by_author returns, in its order."""
+    return [book["id"] for book in book_table.list_by_author(author)]
+
+
+@pytest.mark.parametrize("author", ["orwell", "ORWELL", "tolk", "Lee", "r. r", "zzz"])
+def test_author_index_matches_like_scan(library, author):
+    """Author search through the trigram index returns what the LIKE scan does."""
+    book_table = library.maindb.tables.book
+    assert book_table._author_fts
+
+    indexed = _book_ids_by_author(book_table, author)
+    book_table._author_fts = False
+    assert indexed == _book_ids_by_author(book_table, author)
+
+
+@pytest.mark.parametrize("author", ["", "e", "Le"])
+def test_short_author_query_uses_like_scan(library, author):
+    """Queries under three characters skip the trigram index and scan books."""
+    book_table = library.maindb.tables.book
+    expected = _book_ids_by_author(book_table, author)
+
+    # With the index emptied only the LIKE scan can still find books
+    connection = library.maindb.connection
+    connection.execute("INSERT INTO books_author_fts(books_author_fts) VALUES ('delete-all')")
+    connection.commit()
+
+    assert expected
+    assert _book_ids_by_author(book_table, author) == expected
+    assert _book_ids_by_author(book_table, "orwell") == []
+
+
+def test_author_index_flag_is_per_table():
+    """Creating the author index flags that library's table only."""
+    first = Library(":memory:")
+    second = Library(":memory:")
+    try:
+        first.maindb.tables.book._author_fts = False
+        assert second.maindb.tables.book._author_fts
+        assert not type(second.maindb.tables.book)._author_fts
+    finally:
+        first.close()
+        second.close()
+
+
+def test_read_book_shape(library):
+    """read_book returns the start page and the page contents in order."""
+    connection = library.maindb.connection
+    connection.execute("INSERT INTO book_content VALUES (1, 2, 'page two')")
+    connection.commit()
+
+    assert library.read_book(1, 1, 3) == {
+        "from_page": 1,
+        "pages": ["[Page content not available]", "page two", "[Page content not available]"],
+    }
+    assert library.read_book(1, 2, 2) == {"from_page": 2, "pages": ["page two"]}
+
+
+def test_read_book_defaults_to_last_page(library):
+    """Without to_page, read_book reads up to the book's last page."""
+    row = library.maindb.connection.execute("SELECT pages FROM books WHERE id = 1").fetchone()
+
+    result = library.read_book(1)
+    assert result["from_page"] == 1
+    assert len(result["pages"]) == row["pages"]
+
+
+def test_close_drains_read_pool(tmp_path):
+    """close() closes every pooled reader and leaves none queued for reuse."""
+    lib = Library(str(tmp_path / "library.db"))
+    lib.import_from_csv()
+    lib.get_stats()
+    lib.read_book(1)
+    readers = list(lib._read_connections)
+    assert readers
+
+    lib.close()
+
+    assert lib._read_connections == []
+    assert lib._read_pool.empty()
+    for connection in readers:
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+
+
+def test_reader_in_use_at_close_is_not_pooled(tmp_path):
+    """A reader closed by close() while in use is dropped when released."""
+    lib = Library(str(tmp_path / "library.db"))
+    with lib._read_cursor():
+        lib.close()
+
+    assert lib._read_pool.empty()
+
+
+def test_import_from_csv_skips_blank_lines(tmp_path):
+    """CSV files with blank lines, trailing or not, import like csv.DictReader reads them."""
+    (tmp_path / "shelves.csv").write_text("code,name\nA1,Fiction\n\n", encoding="utf-8")
+    (tmp_path / "books.csv").write_text(
+        "title,author,publisher,pages,genre,shelf_code\n"
+        "Dune,Frank Herbert,Chilton Books,412,Science Fiction,A1\n"
+        "\n"
+        "Emma,Jane Austen,John Murray,474,Fiction,A1\n"
+        "\n",
+        encoding="utf-8",
+    )
+    lib = Library(":memory:")
+    try:
+        lib.import_from_csv(tmp_path)
+        stats = lib.get_stats()
+        assert stats["total_shelves"] == 1
+        assert stats["total_books"] == 2
+    finally:
+        lib.close()
+
+
+def test_csv_columns_single_name_yields_tuples():
+    """A one-column projection still yields tuples."""
+    reader = csv.reader(io.StringIO("code,name\nA1,Fiction\nB2,History\n"))
+    assert list(_csv_columns(reader, ("name",))) == [("Fiction",), ("History",)]
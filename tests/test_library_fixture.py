@@ -0,0 +1,137 @@
+"""Test the SQLite layer of the fixture Library."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from tests.fixtures.library import Library
+
+
+@pytest.fixture
+def library():
+    """Create library with one shelf and one book."""
+    lib = Library(":memory:")
+    lib.add_shelf("A1", "Science Fiction")
+    lib.add_book("Dune", "Frank Herbert", "Chilton Books", 412, "Science Fiction", "A1")
+    yield lib
+    lib.close()
+
+
+def _create_legacy_db(path: str) -> None:
+    """Create a database with the original rowid book_content schema."""
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE shelves (code TEXT PRIMARY KEY, name TEXT NOT NULL);
+        CREATE TABLE books (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            author TEXT NOT NULL,
+            publisher TEXT NOT NULL,
+            pages INTEGER NOT NULL,
+            genre TEXT NOT NULL,
+            shelf_code TEXT NOT NULL,
+            FOREIGN KEY (shelf_code) REFERENCES shelves(code)
+        );
+        CREATE TABLE book_content (
+            book_id INTEGER NOT NULL,
+            page_number INTEGER NOT NULL,
+            content TEXT NOT NULL,
+            PRIMARY KEY (book_id, page_number),
+            FOREIGN KEY (book_id) REFERENCES books(id) ON DELETE CASCADE
+        );
+        INSERT INTO shelves VALUES ('A1', 'Science Fiction');
+        INSERT INTO books VALUES
+            (1, 'Dune', 'Frank Herbert', 'Chilton Books', 412, 'Science Fiction', 'A1');
+        INSERT INTO book_content VALUES (1, 1, 'In the week before their departure...');
+        -- Left behind by a book deleted while foreign_keys was off
+        INSERT INTO book_content VALUES (99, 1, 'orphan page');
+    """)
+    conn.close()
+
+
+def test_legacy_book_content_migration_drops_orphans(tmp_path):
+    """Opening a legacy database migrates book_content and skips orphaned pages."""
+    db_path = str(tmp_path / "legacy.db")
+    _create_legacy_db(db_path)
+
+    lib = Library(db_path)
+    try:
+        sql = lib.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'book_content'"
+        ).fetchone()[0]
+        assert "WITHOUT ROWID" in sql.upper()
+
+        rows = lib.conn.execute(
+            "SELECT book_id, page_number FROM book_content ORDER BY book_id"
+        ).fetchall()
+        assert rows == [(1, 1)]
+        assert lib.get_page_content(1, 1) == "In the week before their departure..."
+    finally:
+        lib.close()
+
+
+def test_book_content_loads_pages_of_its_book(library):
+    """Book.content is loaded on first access with the pages of that book only."""
+    other = library.add_book("Hyperion", "Dan Simmons", "Doubleday", 482, "Science Fiction", "A1")
+    library.add_pages(1, {1: "page one", 2: "page two"})
+    library.add_pages(other.id, {1: "other page"})
+
+    assert library.get_book(1).content == {1: "page one", 2: "page two"}
+    assert library.get_book(other.id).content == {1: "other page"}
+
+
+def test_file_library_reopens_connections_after_close(tmp_path):
+    """close() closes every thread's connection; later access opens new ones."""
+    lib = Library(str(tmp_path / "library.db"))
+    lib.add_shelf("A1", "Science Fiction")
+
+    worker_conns = []
+    worker_shelves = []
+
+    def read_shelves():
+        worker_conns.append(lib.conn)
+        worker_shelves.append([shelf.code for shelf in lib.list_shelves()])
+
+    worker = threading.Thread(target=read_shelves)
+    worker.start()
+    worker.join()
+    main_conn = lib.conn
+    assert worker_conns[0] is not main_conn
+
+    lib.close()
+    for conn in (main_conn, worker_conns[0]):
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    try:
+        assert lib.conn is not main_conn
+        assert [shelf.code for shelf in lib.list_shelves()] == ["A1"]
+
+        worker = threading.Thread(target=read_shelves)
+        worker.start()
+        worker.join()
+        assert worker_conns[1] is not worker_conns[0]
+        assert worker_shelves == [["A1"], ["A1"]]
+    finally:
+        lib.close()
+
+
+def test_add_pages_replaces_existing_pages(library):
+    """add_pages inserts new pages and overwrites the ones already stored."""
+    library.add_pages(1, {1: "draft one", 2: "draft two"})
+    library.add_pages(1, {2: "final two", 3: "final three"})
+
+    assert library.read_book(1, 1, 3) == {
+        1: "draft one",
+        2: "final two",
+        3: "final three",
+    }
+
+
+def test_add_pages_unknown_book(library):
+    """add_pages on a missing book raises KeyError and stores nothing."""
+    with pytest.raises(KeyError, match="Book with ID 99 not found"):
+        library.add_pages(99, {1: "orphan page"})
+
+    assert library.conn.execute("SELECT COUNT(*) FROM book_content").fetchone()[0] == 0
@@ -1,7 +1,12 @@
 """Tests for Publisher class."""
 
+from typing import Annotated, Any
+
 import pytest
+from fastapi.testclient import TestClient
 from genro_api import Publisher
+from genro_core import get_api_structure
+from genro_core.decorators import apiready
 from tests.fixtures.library import Library
 
 
@@ -149,5 +154,262 @@ class TestPublisherWithLibrary:
         assert len(stored_instance.list_all_books()) == 1
 
 
+class TestMapTypeString:
+    """Test parsing of introspected type strings."""
+
+    def test_basic_types(self):
+        """Test basic type names map directly."""
+        assert Publisher._map_type_string("str") is str
+        assert Publisher._map_type_string("dict") is dict
+
+    def test_optional(self):
+        """Test Optional[X] maps to X | None."""
+        assert Publisher._map_type_string("Optional[int]") == int | None
+
+    def test_nested_generics(self):
+        """Test nested parameterized types are resolved recursively."""
+        assert Publisher._map_type_string("dict[str, list[int]]") == dict[str, list[int]]
+        assert Publisher._map_type_string("list[Optional[str]]") == list[str | None]
+
+    def test_ellipsis(self):
+        """Test a variable-length tuple keeps its ellipsis."""
+        assert Publisher._map_type_string("tuple[int, ...]") == tuple[int, ...]
+
+    def test_unknown_name(self):
+        """Test unknown type names, alone or as arguments, map to Any."""
+        assert Publisher._map_type_string("Book") is Any
+        assert Publisher._map_type_string("list[Book]") == list[Any]
+
+
+@apiready(path="/typed")
+class TypedParams:
+    """Published class with non-scalar parameters."""
+
+    @apiready
+    def get_total(self, counts: Annotated[dict[str, int], "Count by name"]) -> int:
+        """Sum the counts."""
+        return sum(counts.values())
+
+    @apiready
+    def set_counts(self, counts: Annotated[dict[str, int], "Count by name"]) -> dict[str, int]:
+        """Echo the counts."""
+        return counts
+
+
+class TestNonScalarParameters:
+    """Test publishing methods with dict parameters."""
+
+    def test_publish_dict_parameters(self):
+        """Test a GET dict parameter falls back to a plain query parameter."""
+        publisher = Publisher(enable_ui=False)
+        publisher.publish(TypedParams())
+
+        client = TestClient(publisher.app)
+        schema = client.get("/openapi.json").json()
+        [parameter] = schema["paths"]["/typed/get_total"]["get"]["parameters"]
+        assert parameter["name"] == "counts"
+        assert parameter["in"] == "query"
+        assert parameter["required"] is True
+        # Declared as Any: an untyped schema, not an object
+        assert "type" not in parameter["schema"]
+
+        response = client.post("/typed/set_counts", json={"counts": {"a": 1, "b": "2"}})
+        assert response.status_code == 200
+        assert response.json() == {"a": 1, "b": 2}
+
+
+@apiready(path="/async_greeter")
+class AsyncGreeter:
+    """Published class with coroutine methods."""
+
+    @apiready
+    async def get_greeting(self, name: Annotated[str, "Name to greet"]) -> str:
+        """Greet someone."""
+        return f"Hello, {name}"
+
+    @apiready
+    async def add_numbers(
+        self, a: Annotated[int, "First number"], b: Annotated[int, "Second number"]
+    ) -> int:
+        """Add two numbers."""
+        return a + b
+
+
+class TestAsyncMethods:
+    """Test publishing coroutine methods."""
+
+    def test_async_methods_are_awaited(self):
+        """Test async GET and POST endpoints return the awaited result."""
+        publisher = Publisher(enable_ui=False)
+        publisher.publish(AsyncGreeter())
+        client = TestClient(publisher.app)
+
+        response = client.get("/async_greeter/get_greeting", params={"name": "Ada"})
+        assert response.status_code == 200
+        assert response.json() == "Hello, Ada"
+
+        response = client.post("/async_greeter/add_numbers", json={"a": 2, "b": 3})
+        assert response.status_code == 200
+        assert response.json() == 5
+
+
+@apiready(path="/leaf")
+class Leaf:
+    """Published grandchild."""
+
+    @apiready
+    def get_name(self) -> str:
+        """Name of the leaf."""
+        return "leaf"
+
+
+@apiready(path="/branch")
+class Branch:
+    """Published child holding a Leaf."""
+
+    def __init__(self, leaf: Leaf):
+        self.leaf = leaf
+
+    @apiready
+    def get_name(self) -> str:
+        """Name of the branch."""
+        return "branch"
+
+
+@apiready(path="/tree")
+class Tree:
+    """Published root reaching the same Leaf through two children."""
+
+    def __init__(self):
+        leaf = Leaf()
+        self.left = Branch(leaf)
+        self.right = Branch(leaf)
+        self.leaf = leaf
+
+
+class TestClassTree:
+    """Test publishing nested children."""
+
+    def test_grandchild_endpoints(self):
+        """Test endpoints of a child's child are published."""
+        publisher = Publisher(enable_ui=False)
+        publisher.publish(Tree())
+        client = TestClient(publisher.app)
+
+        assert client.get("/branch/get_name").json() == "branch"
+        assert client.get("/leaf/get_name").json() == "leaf"
+
+    def test_shared_child_published_once(self):
+        """Test a child reachable through several parents is walked once."""
+        publisher = Publisher(enable_ui=False)
+        tree = Tree()
+        structure = get_api_structure(tree, eager=True, mode="dict")
+
+        nodes = list(publisher._walk_class_tree(tree, structure, "/tree"))
+
+        assert [(path, parent) for path, _, _, parent in nodes] == [
+            ("/tree", None),
+            ("/branch", "/tree"),
+            ("/leaf", "/branch"),
+        ]
+        assert nodes[2][1] is tree.leaf
+
+
+@apiready(path="/catalog")
+class Catalog:
+    """Published child stored in a slot."""
+
+    __slots__ = ("entries",)
+
+    def __init__(self):
+        self.entries = ["Dune"]
+
+    @apiready
+    def list_entries(self) -> list[str]:
+        """List catalog entries."""
+        return self.entries
+
+
+@apiready(path="/archive")
+class Archive:
+    """Published child stored in a slot."""
+
+    __slots__ = ()
+
+    @apiready
+    def get_size(self) -> int:
+        """Number of archived items."""
+        return 0
+
+
+@apiready(path="/slotted")
+class SlottedParent:
+    """Published parent whose children live in __slots__."""
+
+    __slots__ = ("catalog", "archive", "__weakref__")
+
+    def __init__(self):
+        self.catalog = Catalog()
+        self.archive = Archive()
+
+
+class TestSlottedChildren:
+    """Test publishing children held in __slots__."""
+
+    def test_slotted_child_routes(self):
+        """Test children stored in slots are found and their endpoints served."""
+        publisher = Publisher(enable_ui=False)
+        parent = SlottedParent()
+        publisher.publish(parent)
+        client = TestClient(publisher.app)
+
+        assert client.get("/catalog/list_entries").json() == ["Dune"]
+        assert client.get("/archive/get_size").json() == 0
+
+    def test_slotted_parent_index(self):
+        """Test the child index of a slotted parent is built once and cached."""
+        publisher = Publisher(enable_ui=False)
+        parent = SlottedParent()
+
+        index = publisher._index_children(parent)
+
+        assert index == {"Catalog": parent.catalog, "Archive": parent.archive}
+        assert publisher._index_children(parent) is index
+        assert (
+            publisher._find_child_instance(parent, {"class_name": "Archive", "class_obj": Archive})
+            is parent.archive
+        )
+
+
+@apiready(path="/exposed")
+class PropertyParent:
+    """Published parent exposing its child through a property."""
+
+    def __init__(self):
+        self._catalog = Catalog()
+
+    @property
+    def catalog(self) -> Catalog:
+        """Child catalog."""
+        return self._catalog
+
+
+class TestPropertyChildren:
+    """Test children exposed through properties."""
+
+    def test_property_child_found(self):
+        """Test a child behind a property is found when no stored attribute matches."""
+        publisher = Publisher(enable_ui=False)
+        parent = PropertyParent()
+
+        child = publisher._find_child_instance(
+            parent, {"class_name": "Catalog", "class_obj": Catalog}
+        )
+        assert child is parent.catalog
+        assert publisher._find_child_instance(parent, {"class_name": "Catalog"}) is child
+        # The index itself never evaluates properties
+        assert publisher._index_children(parent) == {}
+
+
 # Note: Tests for _generate_rest_endpoints and _register_ui_components
 # will be added when those features are implemented (Issues #3 and #4)
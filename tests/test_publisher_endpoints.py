@@ -77,6 +77,16 @@ def test_shelf_count_books(client):
     assert response.json() == 1
 
 
+def test_add_pages(client, library):
+    """Test POST /library/add_pages with a dict body."""
+    response = client.post(
+        "/library/add_pages",
+        json={"book_id": 1, "pages": {"1": "In the week before their departure..."}},
+    )
+    assert response.status_code == 200
+    assert library.get_page_content(1, 1) == "In the week before their departure..."
+
+
 def test_openapi_schema(client):
     """Test OpenAPI schema generation."""
     response = client.get("/openapi.json")